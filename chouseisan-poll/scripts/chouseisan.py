@@ -11,66 +11,112 @@ Usage:
 
 import argparse
 import json
+import re
 import sys
+from contextlib import contextmanager
+from pathlib import Path
+
 from playwright.sync_api import sync_playwright
 
 
 CHOUSEISAN_URL = "https://chouseisan.com/"
+PROFILE_DIR = Path.home() / ".cache" / "chouseisan-profile"
+
+# フォーム送信に不要なリソース。ブロックして読み込みを高速化する。
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+SHARE_RE = re.compile(r"https://chouseisan\.com/s\?h=[a-f0-9]+")
+
+
+def _wait_for_form(page):
+    """フォームが操作可能になるまで待つ。固定スリープではなく要素の出現で判定する。"""
+    try:
+        page.locator("#name").wait_for(state="visible", timeout=15000)
+        page.locator("#kouho").wait_for(state="visible", timeout=15000)
+    except Exception:
+        # セレクタが変わっていた場合のフォールバック（reconで構造確認する前提）
+        page.wait_for_load_state("networkidle", timeout=10000)
+
+
+@contextmanager
+def _open_browser():
+    """永続プロファイルでChromiumを起動する。
+
+    user_data_dirを使い回すことで2回目以降はキャッシュが効き、
+    画像・フォント等のダウンロードもブロックして読み込みを短縮する。
+    """
+    with sync_playwright() as p:
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=str(PROFILE_DIR),
+            headless=True,
+            args=["--disable-gpu", "--no-sandbox"],
+        )
+        context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+            else route.continue_(),
+        )
+        try:
+            yield context
+        finally:
+            context.close()
 
 
 def cmd_recon(_args):
     """トップページのフォーム構造（id/name属性、placeholder、ボタン）を取得して出力。"""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with _open_browser() as context:
+        page = context.new_page()
         page.goto(CHOUSEISAN_URL, timeout=30000)
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(3000)
+        _wait_for_form(page)
 
-        # フォーム要素を収集
+        # フォーム要素を収集。DOMを1回だけ走査してタグ/typeで振り分ける
         form_info = page.evaluate("""() => {
             const results = { inputs: [], textareas: [], buttons: [], checkboxes: [], selects: [] };
 
-            document.querySelectorAll('input:not([type=hidden])').forEach(el => {
-                results.inputs.push({
-                    id: el.id, name: el.name, type: el.type,
-                    placeholder: el.placeholder, value: el.value,
-                    label: el.labels?.[0]?.textContent?.trim() || ''
-                });
-            });
-
-            document.querySelectorAll('textarea').forEach(el => {
-                results.textareas.push({
-                    id: el.id, name: el.name,
-                    placeholder: el.placeholder,
-                    label: el.labels?.[0]?.textContent?.trim() || ''
-                });
-            });
-
-            document.querySelectorAll('button, input[type=submit], a.btn, .btn').forEach(el => {
-                results.buttons.push({
-                    id: el.id, text: el.textContent?.trim(),
-                    type: el.type || el.tagName, classes: el.className
-                });
-            });
-
-            document.querySelectorAll('input[type=checkbox]').forEach(el => {
-                results.checkboxes.push({
-                    id: el.id, name: el.name, checked: el.checked,
-                    label: el.labels?.[0]?.textContent?.trim() || ''
-                });
-            });
-
-            document.querySelectorAll('select').forEach(el => {
-                const options = [...el.options].map(o => ({ value: o.value, text: o.text }));
-                results.selects.push({ id: el.id, name: el.name, options: options });
+            document.querySelectorAll('input, textarea, button, select, a.btn, .btn').forEach(el => {
+                const tag = el.tagName;
+                if (tag === 'INPUT') {
+                    if (el.type === 'hidden') return;
+                    results.inputs.push({
+                        id: el.id, name: el.name, type: el.type,
+                        placeholder: el.placeholder, value: el.value,
+                        label: el.labels?.[0]?.textContent?.trim() || ''
+                    });
+                    if (el.type === 'checkbox') {
+                        results.checkboxes.push({
+                            id: el.id, name: el.name, checked: el.checked,
+                            label: el.labels?.[0]?.textContent?.trim() || ''
+                        });
+                    } else if (el.type === 'submit' || el.type === 'button'
+                               || el.classList.contains('btn')) {
+                        results.buttons.push({
+                            id: el.id, text: el.textContent?.trim(),
+                            type: el.type, classes: el.className
+                        });
+                    }
+                } else if (tag === 'TEXTAREA') {
+                    results.textareas.push({
+                        id: el.id, name: el.name,
+                        placeholder: el.placeholder,
+                        label: el.labels?.[0]?.textContent?.trim() || ''
+                    });
+                } else if (tag === 'SELECT') {
+                    const options = [...el.options].map(o => ({ value: o.value, text: o.text }));
+                    results.selects.push({ id: el.id, name: el.name, options: options });
+                } else {
+                    // button, a.btn, .btn
+                    results.buttons.push({
+                        id: el.id, text: el.textContent?.trim(),
+                        type: el.type || el.tagName, classes: el.className
+                    });
+                }
             });
 
             return results;
         }""")
 
         page.screenshot(path="/tmp/chouseisan_recon.png", full_page=True)
-        browser.close()
 
     print(json.dumps(form_info, ensure_ascii=False, indent=2))
     print(f"\nScreenshot: /tmp/chouseisan_recon.png", file=sys.stderr)
@@ -78,12 +124,10 @@ def cmd_recon(_args):
 
 def cmd_create(args):
     """イベントを作成して共有URLを返す。"""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    with _open_browser() as context:
+        page = context.new_page()
         page.goto(CHOUSEISAN_URL, timeout=30000)
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(3000)
+        _wait_for_form(page)
 
         # イベント名
         page.fill("#name", args.name)
@@ -98,27 +142,31 @@ def cmd_create(args):
         page.wait_for_timeout(500)
         page.screenshot(path="/tmp/chouseisan_before_submit.png", full_page=True)
 
-        # 送信
+        # 送信。結果ページ（共有URL表示）への遷移を待つ
         page.click("#createBtn")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(5000)
+        try:
+            page.wait_for_url(re.compile(r"chouseisan\.com/s\?h="), timeout=15000)
+        except Exception:
+            # URLパターンが変わっていた場合のフォールバック
+            page.wait_for_load_state("networkidle", timeout=10000)
 
         page.screenshot(path="/tmp/chouseisan_result.png", full_page=True)
         url = page.url
 
-        # 結果ページから共有URLを抽出
-        share_url = page.evaluate("""() => {
+        # 結果ページから共有URLを抽出。正規表現フォールバックはページ全文を
+        # シリアライズせず先頭2000文字だけPython側に渡してここで処理する
+        extracted = page.evaluate("""() => {
             const input = document.querySelector('input[type=text][readonly], input[value*="chouseisan.com/s"]');
-            if (input) return input.value;
+            if (input) return { value: input.value, bodyText: null };
             const el = document.querySelector('.text-url, #shareUrl, [class*=url]');
-            if (el) return el.textContent?.trim();
-            // テキスト内からURL抽出
-            const body = document.body.innerText;
-            const m = body.match(/https:\\/\\/chouseisan\\.com\\/s\\?h=[a-f0-9]+/);
-            return m ? m[0] : null;
+            if (el) return { value: el.textContent?.trim(), bodyText: null };
+            return { value: null, bodyText: document.body.innerText.slice(0, 2000) };
         }""")
 
-        browser.close()
+        share_url = extracted.get("value")
+        if not share_url and extracted.get("bodyText"):
+            m = SHARE_RE.search(extracted["bodyText"])
+            share_url = m.group(0) if m else None
 
     result = {
         "page_url": url,
@@ -7,6 +7,7 @@ Usage:
     gcal.py events --start <date> --end <date>      # 予定一覧
     gcal.py busy --start <date> --end <date>        # busy/freeサマリー
     gcal.py create --summary <title> --start <dt> --end <dt>  # 予定作成
+    gcal.py create-bulk --file <events.json>        # 予定の一括作成
 
 Date formats: today, tomorrow, YYYY-MM-DD, +Nd (e.g. +7d)
 
@@ -19,7 +20,7 @@ import json
 import os
 import re
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -30,15 +31,23 @@ SCOPES = ["https://www.googleapis.com/auth/calendar"]
 DEFAULT_CREDS_DIR = Path.home() / ".config" / "google-calendar"
 
 
+_DOTENV_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)")
+_dotenv_loaded = False
+
+
 def load_dotenv():
-    """Load skill-local .env file into os.environ."""
+    """Load skill-local .env file into os.environ (once per process)."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
     if not ENV_FILE.exists():
         return
     for line in ENV_FILE.read_text().splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
             continue
-        m = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)", line)
+        m = _DOTENV_RE.match(line)
         if m:
             key, val = m.group(1), m.group(2)
             val = val.strip("'\"")
@@ -75,6 +84,72 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%Y-%m-%d")
 
 
+def get_discovery_cache_file() -> Path:
+    return get_creds_dir() / "calendar_v3_discovery.json"
+
+
+_session = None
+_authed_http = None
+
+
+def _get_session():
+    """Shared requests.Session so token refresh reuses one pooled connection."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _session = requests.Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return _session
+
+
+def _get_authed_http(creds):
+    """Shared AuthorizedHttp so all API calls in a process reuse one TLS connection."""
+    global _authed_http
+    if _authed_http is None:
+        import google_auth_httplib2
+        import httplib2
+
+        _authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(cache=None))
+    return _authed_http
+
+
+def _build_service(creds):
+    """Build the Calendar API service, caching the discovery document locally.
+
+    By default build() fetches the v3 discovery JSON over HTTPS on every
+    invocation; caching it on disk removes one round-trip per CLI run.
+    """
+    from googleapiclient.discovery import build, build_from_document
+
+    authed_http = _get_authed_http(creds)
+    cache_file = get_discovery_cache_file()
+    if cache_file.exists():
+        try:
+            return build_from_document(cache_file.read_text(), http=authed_http)
+        except (OSError, ValueError):
+            pass  # unreadable/corrupt cache: fall through and re-fetch
+
+    service = build(
+        "calendar", "v3", http=authed_http,
+        cache_discovery=False, static_discovery=False,
+    )
+    try:
+        doc = service._rootDesc  # discovery document already fetched by build()
+    except AttributeError:
+        return service  # private attribute gone in a future client release
+    try:
+        # Write via tmp + rename so a killed process can't leave a torn cache.
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(doc))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # cache is best-effort; the service still works without it
+    return service
+
+
 def get_credentials():
     """Get or refresh OAuth credentials."""
     from google.auth.transport.requests import Request
@@ -84,9 +159,21 @@ def get_credentials():
     creds = None
     if token_file.exists():
         creds = Credentials.from_authorized_user_file(str(token_file), SCOPES)
-    if creds and creds.expired and creds.refresh_token:
-        creds.refresh(Request())
-        token_file.write_text(creds.to_json())
+    if creds and creds.refresh_token:
+        # Only refresh when the token is expired or about to expire (60s skew),
+        # so runs with a fresh token skip the round-trip to the token endpoint.
+        # creds.expiry is naive UTC, so compare against a naive UTC now
+        # (datetime.utcnow() is deprecated and warns on 3.12+).
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        needs_refresh = creds.expired or (
+            creds.expiry and (creds.expiry - now_utc).total_seconds() < 60
+        )
+        if needs_refresh:
+            creds.refresh(Request(session=_get_session()))
+            new_json = creds.to_json()
+            # Skip the rewrite when the serialized token is unchanged on disk.
+            if new_json.encode() != token_file.read_bytes():
+                token_file.write_text(new_json)
     return creds
 
 
@@ -115,14 +202,12 @@ def cmd_auth(_args):
 
 def cmd_events(args):
     """List events in a date range."""
-    from googleapiclient.discovery import build
-
     creds = get_credentials()
     if not creds or not creds.valid:
         print("Error: Not authenticated. Run 'gcal.py auth' first.", file=sys.stderr)
         sys.exit(1)
 
-    service = build("calendar", "v3", credentials=creds)
+    service = _build_service(creds)
 
     start_dt = parse_date(args.start)
     end_dt = parse_date(args.end) + timedelta(days=1)  # inclusive end
@@ -131,19 +216,30 @@ def cmd_events(args):
     time_min = start_dt.isoformat() + "Z"
     time_max = end_dt.isoformat() + "Z"
 
-    events_result = (
-        service.events()
-        .list(
-            calendarId=calendar_id,
-            timeMin=time_min,
-            timeMax=time_max,
-            singleEvents=True,
-            orderBy="startTime",
+    # Project only the fields we output, and page through large ranges
+    # instead of silently truncating at the server's default page size.
+    list_kwargs = {
+        "calendarId": calendar_id,
+        "timeMin": time_min,
+        "timeMax": time_max,
+        "singleEvents": True,
+        "maxResults": 2500,
+        "fields": "nextPageToken,items(summary,start,end,location,description,htmlLink)",
+    }
+    if args.sorted:
+        # orderBy forces server-side expansion + sort; only pay for it on request.
+        list_kwargs["orderBy"] = "startTime"
+
+    events = []
+    page_token = None
+    while True:
+        events_result = (
+            service.events().list(pageToken=page_token, **list_kwargs).execute()
         )
-        .execute()
-    )
-
-    events = events_result.get("items", [])
+        events.extend(events_result.get("items", []))
+        page_token = events_result.get("nextPageToken")
+        if not page_token:
+            break
     output = []
     for event in events:
         start = event["start"].get("dateTime", event["start"].get("date"))
@@ -164,31 +260,44 @@ def cmd_events(args):
 
 def cmd_busy(args):
     """Get busy/free summary for a date range."""
-    from googleapiclient.discovery import build
-
     creds = get_credentials()
     if not creds or not creds.valid:
         print("Error: Not authenticated. Run 'gcal.py auth' first.", file=sys.stderr)
         sys.exit(1)
 
-    service = build("calendar", "v3", credentials=creds)
+    service = _build_service(creds)
 
     start_dt = parse_date(args.start)
     end_dt = parse_date(args.end) + timedelta(days=1)
-    calendar_id = args.calendar_id or "primary"
+    calendar_ids = [c.strip() for c in (args.calendar_ids or "primary").split(",") if c.strip()]
 
+    # freebusy.query takes up to 50 calendars per request, so overlaying
+    # several calendars costs one round-trip instead of one per calendar.
     body = {
         "timeMin": start_dt.isoformat() + "Z",
         "timeMax": end_dt.isoformat() + "Z",
-        "items": [{"id": calendar_id}],
+        "items": [{"id": c} for c in calendar_ids],
     }
 
     result = service.freebusy().query(body=body).execute()
     calendars = result.get("calendars", {})
-    busy_times = calendars.get(calendar_id, {}).get("busy", [])
+    busy_by_calendar = {c: calendars.get(c, {}).get("busy", []) for c in calendar_ids}
+
+    # Merge overlapping windows across calendars (sort + sweep).
+    # RFC 3339 UTC timestamps from the API compare correctly as strings.
+    intervals = sorted(
+        (b["start"], b["end"]) for busy in busy_by_calendar.values() for b in busy
+    )
+    merged = []
+    for s, e in intervals:
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(e, merged[-1][1])
+        else:
+            merged.append([s, e])
+    busy_times = [{"start": s, "end": e} for s, e in merged]
 
     output = {
-        "calendar": calendar_id,
+        "calendars": busy_by_calendar,
         "range": {"start": start_dt.isoformat(), "end": end_dt.isoformat()},
         "busy": busy_times,
         "busyCount": len(busy_times),
@@ -199,14 +308,12 @@ def cmd_busy(args):
 
 def cmd_create(args):
     """Create a new calendar event."""
-    from googleapiclient.discovery import build
-
     creds = get_credentials()
     if not creds or not creds.valid:
         print("Error: Not authenticated. Run 'gcal.py auth' first.", file=sys.stderr)
         sys.exit(1)
 
-    service = build("calendar", "v3", credentials=creds)
+    service = _build_service(creds)
     calendar_id = args.calendar_id or "primary"
     timezone = args.timezone
 
@@ -231,6 +338,53 @@ def cmd_create(args):
     }, ensure_ascii=False, indent=2))
 
 
+BATCH_SIZE = 50  # Calendar API limit per batch request
+
+
+def cmd_create_bulk(args):
+    """Create many events in batched requests (50 per HTTP round-trip)."""
+    creds = get_credentials()
+    if not creds or not creds.valid:
+        print("Error: Not authenticated. Run 'gcal.py auth' first.", file=sys.stderr)
+        sys.exit(1)
+
+    if args.file:
+        events = json.loads(Path(args.file).read_text())
+    else:
+        events = json.load(sys.stdin)
+    if not isinstance(events, list):
+        print("Error: Input must be a JSON array of event bodies.", file=sys.stderr)
+        sys.exit(1)
+
+    service = _build_service(creds)
+    calendar_id = args.calendar_id or "primary"
+
+    results = [None] * len(events)
+
+    def on_done(request_id, response, exception):
+        i = int(request_id)
+        if exception is not None:
+            results[i] = {"status": "error", "error": str(exception)}
+        else:
+            results[i] = {
+                "status": "created",
+                "id": response["id"],
+                "summary": response.get("summary"),
+                "htmlLink": response.get("htmlLink", ""),
+            }
+
+    for offset in range(0, len(events), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=on_done)
+        for i, event_body in enumerate(events[offset:offset + BATCH_SIZE], start=offset):
+            batch.add(
+                service.events().insert(calendarId=calendar_id, body=event_body),
+                request_id=str(i),
+            )
+        batch.execute()
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Google Calendar CLI")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -243,12 +397,16 @@ def main():
     events_parser.add_argument("--start", required=True, help="Start date")
     events_parser.add_argument("--end", required=True, help="End date")
     events_parser.add_argument("--calendar-id", help="Calendar ID (default: primary)")
+    events_parser.add_argument("--sorted", action="store_true", help="Sort by start time (server-side)")
 
     # busy
     busy_parser = subparsers.add_parser("busy", help="Get busy/free summary")
     busy_parser.add_argument("--start", required=True, help="Start date")
     busy_parser.add_argument("--end", required=True, help="End date")
-    busy_parser.add_argument("--calendar-id", help="Calendar ID (default: primary)")
+    busy_parser.add_argument(
+        "--calendar-ids", "--calendar-id", dest="calendar_ids",
+        help="Comma-separated calendar IDs (default: primary)",
+    )
 
     # create
     create_parser = subparsers.add_parser("create", help="Create a new event")
@@ -260,9 +418,20 @@ def main():
     create_parser.add_argument("--location", help="Event location")
     create_parser.add_argument("--calendar-id", help="Calendar ID (default: primary)")
 
+    # create-bulk
+    create_bulk_parser = subparsers.add_parser("create-bulk", help="Create many events from a JSON array")
+    create_bulk_parser.add_argument("--file", help="JSON file with an array of event bodies (default: stdin)")
+    create_bulk_parser.add_argument("--calendar-id", help="Calendar ID (default: primary)")
+
     args = parser.parse_args()
 
-    commands = {"auth": cmd_auth, "events": cmd_events, "busy": cmd_busy, "create": cmd_create}
+    commands = {
+        "auth": cmd_auth,
+        "events": cmd_events,
+        "busy": cmd_busy,
+        "create": cmd_create,
+        "create-bulk": cmd_create_bulk,
+    }
     commands[args.command](args)
 
 
@@ -10,24 +10,69 @@ X-Scheduler: X予約投稿の管理スクリプト
 """
 
 import os
+import re
 import sys
 import json
-import argparse
-import hashlib
-from datetime import datetime, timezone
+import functools
+import secrets
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 try:
-    from zoneinfo import ZoneInfo
+    import orjson  # 任意依存。あればJSONの読み書きが速くなる
 except ImportError:
-    from backports.zoneinfo import ZoneInfo
+    orjson = None
+
+
+def load_json_file(path) -> dict:
+    """投稿JSONを読む（orjsonがあればC実装でパース）"""
+    with open(path, 'rb') as fh:
+        raw = fh.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json_file(path, data: dict):
+    """投稿JSONを書く（インデント付き、orjsonがあればC実装でシリアライズ）
+
+    tmpファイルに書いてからrenameするので、途中でプロセスが落ちても
+    書きかけのJSONが残らない（POSIXではos.replaceはアトミック）。
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as fh:
+        fh.write(raw)
+    os.replace(tmp, path)
+
 
+@functools.lru_cache(maxsize=64)
+def _get_tz(name: str):
+    """タイムゾーンを取得（キャッシュ付き）
 
+    ZoneInfoの構築は /usr/share/zoneinfo のファイル読みを伴うので、
+    同じ名前の再構築はlru_cacheで1回にする。importもここまで遅延。
+    """
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:
+        from backports.zoneinfo import ZoneInfo
+    return ZoneInfo(name)
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """プロジェクトルートを取得（カレントディレクトリから.git探索）"""
+    """プロジェクトルートを取得（環境変数 or カレントディレクトリから.git探索）"""
+    env_root = os.environ.get('X_SCHEDULER_ROOT')
+    if env_root:
+        return Path(env_root)
     cwd = Path.cwd()
     for parent in [cwd, *cwd.parents]:
-        if (parent / '.git').exists():
+        # Path連結+exists()よりos.pathの方が安い（worktreeでは.gitはファイル）
+        if os.path.exists(os.path.join(parent, '.git')):
             return parent
     return cwd
 
@@ -40,16 +85,63 @@ def get_done_dir(project_root: Path) -> Path:
     return project_root / 'scheduled-posts' / 'done'
 
 
-def glob_json(directory: Path) -> list[Path]:
-    """*.json をglobし、macOSの ._ メタデータファイルを除外"""
-    return sorted(f for f in directory.glob('*.json') if not f.name.startswith('._'))
+def glob_json(directory: Path) -> list[os.DirEntry]:
+    """*.json を列挙し、macOSの ._ メタデータファイルを除外（名前順）
+
+    Pathを1ファイルごとに生成するglobではなくscandirのDirEntryを
+    そのまま返す。大きなキューでもアロケーションが少なく済む。
+    """
+    it = (
+        e for e in os.scandir(directory)
+        if e.name.endswith('.json') and not e.name.startswith('._') and e.is_file()
+    )
+    return sorted(it, key=lambda e: e.name)
+
+
+# "2026-02-25 09:00" / "2026-02-25 09:00:30"（秒は任意）
+_DATETIME_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})(?::(\d{2}))?')
+
+
+def _parse_datetime(dt_str: str):
+    """'YYYY-MM-DD HH:MM[:SS]' をnaiveなdatetimeにする。不正ならNone
+
+    固定フォーマットなのでstrptimeのフォーマット解釈を通さず
+    正規表現のグループから直接組み立てる。
+    """
+    m = _DATETIME_RE.fullmatch(dt_str)
+    if m:
+        try:
+            return datetime(
+                int(m.group(1)), int(m.group(2)), int(m.group(3)),
+                int(m.group(4)), int(m.group(5)), int(m.group(6) or 0),
+            )
+        except ValueError:
+            return None
+    try:
+        # 将来の追加フォーマット用フォールバック
+        return datetime.strptime(dt_str, '%Y-%m-%d %H:%M')
+    except ValueError:
+        return None
+
+
+def iter_posts(directory: Path):
+    """ディレクトリ内の投稿JSONを (DirEntry, dict) で順に返す共有ローダー
+
+    壊れたJSONは警告を出してスキップする。結果はプロセス内でキャッシュ
+    しない: post-dueが同一プロセスでファイルを動かすため、メモ化すると
+    古い内容を返してしまう。
+    """
+    for f in glob_json(directory):
+        try:
+            yield f, load_json_file(f)
+        except ValueError:
+            print(f"警告: 壊れたJSONをスキップしました: {f.name}", file=sys.stderr)
 
 
 def generate_post_id(scheduled_at: datetime) -> str:
     """投稿IDを生成"""
     ts = scheduled_at.strftime('%Y%m%d_%H%M%S')
-    hash_part = hashlib.md5(f"{ts}{datetime.now().isoformat()}".encode()).hexdigest()[:6]
-    return f"{ts}_{hash_part}"
+    return f"{ts}_{secrets.token_hex(3)}"
 
 
 # ============================================================
@@ -60,20 +152,9 @@ def cmd_add(args, project_root: Path):
     scheduled_dir = get_scheduled_dir(project_root)
     scheduled_dir.mkdir(parents=True, exist_ok=True)
 
-    tz = ZoneInfo(args.timezone)
-    # パース: "2026-02-25 09:00" or "2026-02-25T09:00"
-    dt_str = args.datetime.replace('T', ' ')
-    try:
-        naive = datetime.strptime(dt_str, '%Y-%m-%d %H:%M')
-    except ValueError:
-        try:
-            naive = datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
-        except ValueError:
-            print(f"エラー: 日時の形式が不正です: {args.datetime}", file=sys.stderr)
-            print("形式: YYYY-MM-DD HH:MM", file=sys.stderr)
-            sys.exit(1)
-
-    scheduled_at = naive.replace(tzinfo=tz)
+    # --datetime / --timezone はargparseのtype=で変換済み
+    tz = args.timezone
+    scheduled_at = args.datetime.replace(tzinfo=tz)
     now = datetime.now(tz)
 
     if scheduled_at <= now:
@@ -94,8 +175,7 @@ def cmd_add(args, project_root: Path):
     }
 
     filepath = scheduled_dir / f"{post_id}.json"
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(post_data, f, ensure_ascii=False, indent=2)
+    dump_json_file(filepath, post_data)
 
     print(f"予約投稿を追加しました")
     print(f"  ID: {post_id}")
@@ -117,27 +197,27 @@ def cmd_list(args, project_root: Path):
         return
 
     posts = []
-    for f in glob_json(scheduled_dir):
-        with open(f, 'r', encoding='utf-8') as fh:
-            data = json.load(fh)
-            if data.get('status') == 'pending':
-                posts.append(data)
+    for _f, data in iter_posts(scheduled_dir):
+        if data.get('status') == 'pending':
+            posts.append(data)
 
     if not posts:
         print("予約投稿はありません。")
         return
 
-    posts.sort(key=lambda x: x['scheduled_at'])
-    print(f"予約投稿一覧 ({len(posts)}件):")
-    print("-" * 60)
+    # ファイル名先頭が予定時刻（YYYYMMDD_HHMMSS）なので、
+    # glob_jsonの名前順がそのまま予定時刻順になっている
+    # 1投稿ごとにprintせず、まとめて1回で書き出す
+    lines = [f"予約投稿一覧 ({len(posts)}件):", "-" * 60]
     for p in posts:
         label = f" [{p['label']}]" if p.get('label') else ""
         dt = datetime.fromisoformat(p['scheduled_at'])
-        print(f"  {p['id']}{label}")
-        print(f"    予定: {dt.strftime('%Y-%m-%d %H:%M %Z')}")
+        lines.append(f"  {p['id']}{label}")
+        lines.append(f"    予定: {dt.strftime('%Y-%m-%d %H:%M %Z')}")
         text_preview = p['text'][:60].replace('\n', ' ')
-        print(f"    内容: {text_preview}{'...' if len(p['text']) > 60 else ''}")
-        print()
+        lines.append(f"    内容: {text_preview}{'...' if len(p['text']) > 60 else ''}")
+        lines.append("")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # ============================================================
@@ -166,28 +246,25 @@ def cmd_history(args, project_root: Path):
         print("投稿履歴はありません。")
         return
 
-    posts = []
-    for f in glob_json(done_dir):
-        with open(f, 'r', encoding='utf-8') as fh:
-            posts.append(json.load(fh))
+    posts = [data for _f, data in iter_posts(done_dir)]
 
     if not posts:
         print("投稿履歴はありません。")
         return
 
     posts.sort(key=lambda x: x.get('posted_at', x['scheduled_at']), reverse=True)
-    print(f"投稿履歴 ({len(posts)}件):")
-    print("-" * 60)
+    lines = [f"投稿履歴 ({len(posts)}件):", "-" * 60]
     for p in posts:
         posted = p.get('posted_at', '不明')
         tweet_url = p.get('tweet_url', '')
-        print(f"  {p['id']}")
-        print(f"    投稿日時: {posted}")
+        lines.append(f"  {p['id']}")
+        lines.append(f"    投稿日時: {posted}")
         if tweet_url:
-            print(f"    URL: {tweet_url}")
+            lines.append(f"    URL: {tweet_url}")
         text_preview = p['text'][:60].replace('\n', ' ')
-        print(f"    内容: {text_preview}{'...' if len(p['text']) > 60 else ''}")
-        print()
+        lines.append(f"    内容: {text_preview}{'...' if len(p['text']) > 60 else ''}")
+        lines.append("")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # ============================================================
@@ -206,9 +283,17 @@ def cmd_post_due(args, project_root: Path):
     now = datetime.now(timezone.utc)
     posted_count = 0
 
+    # ファイル名先頭の YYYYMMDD_HHMMSS は投稿のローカル時刻なので、
+    # 最大UTCオフセット(+14h)の猶予を足したカットオフより先のファイルは
+    # まだ投稿時刻になり得ない。glob_jsonは名前順なので開かずに打ち切れる。
+    cutoff = (now + timedelta(hours=14)).strftime('%Y%m%d_%H%M%S')
+
+    # まず投稿対象を集める
+    due = []
     for f in glob_json(scheduled_dir):
-        with open(f, 'r', encoding='utf-8') as fh:
-            data = json.load(fh)
+        if f.name[:15] > cutoff:
+            break
+        data = load_json_file(f)
 
         if data.get('status') != 'pending':
             continue
@@ -217,10 +302,11 @@ def cmd_post_due(args, project_root: Path):
         if scheduled_at.tzinfo is None:
             scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
 
-        if scheduled_at > now:
-            continue
+        if scheduled_at <= now:
+            due.append((f, data))
 
-        # 投稿実行
+    def _post_one(item):
+        _f, data = item
         print(f"投稿中: {data['id']} ...")
         try:
             result = post_to_x(data)
@@ -235,18 +321,31 @@ def cmd_post_due(args, project_root: Path):
             data['posted_at'] = datetime.now(timezone.utc).isoformat()
             print(f"  失敗: {e}", file=sys.stderr)
 
-        # done/ に移動
-        done_path = done_dir / f.name
-        with open(done_path, 'w', encoding='utf-8') as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
-        f.unlink()
+    if due:
+        # 投稿はネットワーク待ちが支配的なのでスレッドで並列化
+        # （worker数はX APIのレート制限を考慮して控えめに）
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_post_one, due))
+
+    # 更新内容を元ファイルに書き戻してから done/ へrenameで移動する。
+    # コピー+unlinkと違いデータブロックの再書き込みが発生しない。
+    for f, data in due:
+        dump_json_file(f.path, data)
+        os.replace(f.path, done_dir / f.name)
         posted_count += 1
 
     print(f"\n処理完了: {posted_count}件投稿しました。")
 
 
-def post_to_x(data: dict) -> dict:
-    """X APIで投稿する（tweepyを使用）"""
+@functools.lru_cache(maxsize=1)
+def _get_x_client():
+    """tweepy Clientを生成する（プロセス内で1つを使い回す）
+
+    Clientは内部にrequests.Sessionを持つので、使い回すことで
+    複数投稿時にTLSハンドシェイクが1回で済む。
+    """
     try:
         import tweepy
     except ImportError:
@@ -264,13 +363,18 @@ def post_to_x(data: dict) -> dict:
             "X_ACCESS_TOKEN, X_ACCESS_TOKEN_SECRET を設定してください。"
         )
 
-    client = tweepy.Client(
+    return tweepy.Client(
         consumer_key=api_key,
         consumer_secret=api_key_secret,
         access_token=access_token,
         access_token_secret=access_token_secret,
     )
 
+
+def post_to_x(data: dict) -> dict:
+    """X APIで投稿する（tweepyを使用）"""
+    client = _get_x_client()
+
     kwargs = {"text": data['text']}
     if data.get('reply_to'):
         kwargs["in_reply_to_tweet_id"] = data['reply_to']
@@ -363,6 +467,7 @@ scheduled-posts/ 内の pending な投稿を時刻チェックして投稿する
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -373,21 +478,32 @@ except ImportError:
     sys.exit(1)
 
 
-def post_to_x(data: dict) -> dict:
-    api_key = os.getenv('X_API_KEY')
-    api_key_secret = os.getenv('X_API_KEY_SECRET')
-    access_token = os.getenv('X_ACCESS_TOKEN')
-    access_token_secret = os.getenv('X_ACCESS_TOKEN_SECRET')
+_client = None
 
-    if not all([api_key, api_key_secret, access_token, access_token_secret]):
-        raise ValueError("X API credentials not set in environment/secrets.")
 
-    client = tweepy.Client(
-        consumer_key=api_key,
-        consumer_secret=api_key_secret,
-        access_token=access_token,
-        access_token_secret=access_token_secret,
-    )
+def get_client():
+    # Clientを使い回すことで複数投稿時もTLSハンドシェイクが1回で済む
+    global _client
+    if _client is None:
+        api_key = os.getenv('X_API_KEY')
+        api_key_secret = os.getenv('X_API_KEY_SECRET')
+        access_token = os.getenv('X_ACCESS_TOKEN')
+        access_token_secret = os.getenv('X_ACCESS_TOKEN_SECRET')
+
+        if not all([api_key, api_key_secret, access_token, access_token_secret]):
+            raise ValueError("X API credentials not set in environment/secrets.")
+
+        _client = tweepy.Client(
+            consumer_key=api_key,
+            consumer_secret=api_key_secret,
+            access_token=access_token,
+            access_token_secret=access_token_secret,
+        )
+    return _client
+
+
+def post_to_x(data: dict) -> dict:
+    client = get_client()
 
     kwargs = {"text": data['text']}
     if data.get('reply_to'):
@@ -402,14 +518,33 @@ def post_to_x(data: dict) -> dict:
     }
 
 
+def post_one(item):
+    f, data = item
+    print(f"Posting: {data['id']} ...")
+    now = datetime.now(timezone.utc)
+    try:
+        result = post_to_x(data)
+        data['status'] = 'posted'
+        data['posted_at'] = now.isoformat()
+        data['tweet_id'] = result['tweet_id']
+        data['tweet_url'] = result['url']
+        print(f"  OK: {result['url']}")
+    except Exception as e:
+        data['status'] = 'failed'
+        data['error'] = str(e)
+        data['posted_at'] = now.isoformat()
+        print(f"  FAILED: {e}", file=sys.stderr)
+
+
 def main():
     base_dir = Path(__file__).parent
     done_dir = base_dir / 'done'
     done_dir.mkdir(exist_ok=True)
 
     now = datetime.now(timezone.utc)
-    posted = 0
 
+    # 1) 読み取り: 投稿対象を集める
+    due = []
     for f in sorted(base_dir.glob('*.json')):
         if f.name.startswith('._'):
             continue
@@ -425,33 +560,26 @@ def main():
             scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
 
         # UTC に変換して比較
-        scheduled_utc = scheduled_at.astimezone(timezone.utc)
-        if scheduled_utc > now:
+        if scheduled_at.astimezone(timezone.utc) > now:
             print(f"Skip (not yet): {data['id']} scheduled at {scheduled_at.isoformat()}")
             continue
 
-        print(f"Posting: {data['id']} ...")
-        try:
-            result = post_to_x(data)
-            data['status'] = 'posted'
-            data['posted_at'] = now.isoformat()
-            data['tweet_id'] = result['tweet_id']
-            data['tweet_url'] = result['url']
-            print(f"  OK: {result['url']}")
-        except Exception as e:
-            data['status'] = 'failed'
-            data['error'] = str(e)
-            data['posted_at'] = now.isoformat()
-            print(f"  FAILED: {e}", file=sys.stderr)
+        due.append((f, data))
+
+    # 2) 投稿: ネットワーク待ちが支配的なのでスレッドで並列化
+    if due:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(post_one, due))
 
-        # done/ に移動
-        done_path = done_dir / f.name
-        with open(done_path, 'w', encoding='utf-8') as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
-        f.unlink()
-        posted += 1
+    # 3) 書き込み: tmpに書いてrenameでアトミックに更新し、done/ へ移動
+    for f, data in due:
+        tmp = Path(str(f) + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            fh.write(json.dumps(data, ensure_ascii=False, indent=2))
+        os.replace(tmp, f)
+        os.replace(f, done_dir / f.name)
 
-    print(f"\\nDone: {posted} post(s) processed.")
+    print(f"\\nDone: {len(due)} post(s) processed.")
 
 
 if __name__ == '__main__':
@@ -510,55 +638,127 @@ def cmd_setup(args, project_root: Path):
 # ============================================================
 # main
 # ============================================================
-def main():
-    parser = argparse.ArgumentParser(description='X予約投稿マネージャー')
-    subparsers = parser.add_subparsers(dest='command', help='コマンド')
+def _datetime_arg(value: str) -> datetime:
+    """argparse用: --datetime をパース時にdatetimeへ変換する"""
+    naive = _parse_datetime(value.replace('T', ' '))
+    if naive is None:
+        import argparse
+        raise argparse.ArgumentTypeError(f"日時の形式が不正です: {value} (形式: YYYY-MM-DD HH:MM)")
+    return naive
+
+
+def _timezone_arg(value: str):
+    """argparse用: --timezone をパース時にZoneInfoへ変換する"""
+    try:
+        return _get_tz(value)
+    except Exception:
+        import argparse
+        raise argparse.ArgumentTypeError(f"不明なタイムゾーンです: {value}")
 
-    # add
-    add_parser = subparsers.add_parser('add', help='予約投稿を追加')
+
+def _register_add(subparsers):
+    add_parser = subparsers.add_parser('add', help='予約投稿を追加', allow_abbrev=False)
     add_parser.add_argument('--text', '-t', required=True, help='投稿内容')
-    add_parser.add_argument('--datetime', '-d', required=True, help='投稿日時 (YYYY-MM-DD HH:MM)')
-    add_parser.add_argument('--timezone', '-tz', default='Asia/Tokyo', help='タイムゾーン (デフォルト: Asia/Tokyo)')
+    add_parser.add_argument('--datetime', '-d', required=True, type=_datetime_arg,
+                            help='投稿日時 (YYYY-MM-DD HH:MM)')
+    add_parser.add_argument('--timezone', '-tz', default='Asia/Tokyo', type=_timezone_arg,
+                            help='タイムゾーン (デフォルト: Asia/Tokyo)')
     add_parser.add_argument('--reply-to', help='返信先ツイートID')
     add_parser.add_argument('--quote', help='引用元ツイートID')
     add_parser.add_argument('--label', '-l', help='管理用ラベル')
 
-    # list
+
+def _register_list(subparsers):
     subparsers.add_parser('list', help='予約一覧を表示')
 
-    # cancel
-    cancel_parser = subparsers.add_parser('cancel', help='予約をキャンセル')
+
+def _register_cancel(subparsers):
+    cancel_parser = subparsers.add_parser('cancel', help='予約をキャンセル', allow_abbrev=False)
     cancel_parser.add_argument('post_id', help='キャンセルする投稿ID')
 
-    # history
+
+def _register_history(subparsers):
     subparsers.add_parser('history', help='投稿済み履歴を表示')
 
+
+def _register_post_due(subparsers):
     # post-due (GitHub Actions用)
     subparsers.add_parser('post-due', help='投稿時刻を過ぎたものを投稿')
 
-    # setup
+
+def _register_setup(subparsers):
     subparsers.add_parser('setup', help='初回セットアップ')
 
+
+_SUBPARSERS = {
+    'add': _register_add,
+    'list': _register_list,
+    'cancel': _register_cancel,
+    'history': _register_history,
+    'post-due': _register_post_due,
+    'setup': _register_setup,
+}
+
+_DISPATCH = {
+    'add': cmd_add,
+    'list': cmd_list,
+    'cancel': cmd_cancel,
+    'history': cmd_history,
+    'post-due': cmd_post_due,
+    'setup': cmd_setup,
+}
+
+# 引数を取らないサブコマンド。argparseを構築せず直接ディスパッチできる
+_ZERO_ARG_COMMANDS = {
+    'list': cmd_list,
+    'history': cmd_history,
+    'post-due': cmd_post_due,
+    'setup': cmd_setup,
+}
+
+
+_USAGE = """\
+usage: scheduler.py [-h] {add,list,cancel,history,post-due,setup} ...
+詳細: scheduler.py --help
+"""
+
+
+def main():
+    # コマンドなしの起動はargparseを構築せず最小限のusageだけ出す
+    if len(sys.argv) < 2:
+        sys.stderr.write(_USAGE)
+        sys.exit(1)
+
+    # post-due はcronから数分おきに呼ばれる最頻パスなので、引数なしの
+    # サブコマンドはargparseのimport・構築を一切せずに実行する
+    if len(sys.argv) == 2 and sys.argv[1] in _ZERO_ARG_COMMANDS:
+        return _ZERO_ARG_COMMANDS[sys.argv[1]](None, get_project_root())
+
+    import argparse
+
+    # allow_abbrev=False で長いオプションの前方一致テーブル構築を省く
+    # （--time が --timezone に化けるような曖昧マッチも防げる）
+    parser = argparse.ArgumentParser(description='X予約投稿マネージャー', allow_abbrev=False)
+    subparsers = parser.add_subparsers(dest='command', help='コマンド')
+
+    # 実行するサブコマンドのパーサーだけ構築する（argparseの構築は
+    # 短命CLIの起動コストとして無視できない）。--help・不明コマンドは
+    # 従来どおり全サブコマンドを登録してargparseに任せる。
+    cmd = sys.argv[1] if len(sys.argv) > 1 else None
+    if cmd in _SUBPARSERS:
+        _SUBPARSERS[cmd](subparsers)
+    else:
+        for register in _SUBPARSERS.values():
+            register(subparsers)
+
     args = parser.parse_args()
 
-    if not args.command:
+    handler = _DISPATCH.get(args.command)
+    if handler is None:
         parser.print_help()
         sys.exit(1)
 
-    project_root = get_project_root()
-
-    if args.command == 'add':
-        cmd_add(args, project_root)
-    elif args.command == 'list':
-        cmd_list(args, project_root)
-    elif args.command == 'cancel':
-        cmd_cancel(args, project_root)
-    elif args.command == 'history':
-        cmd_history(args, project_root)
-    elif args.command == 'post-due':
-        cmd_post_due(args, project_root)
-    elif args.command == 'setup':
-        cmd_setup(args, project_root)
+    handler(args, get_project_root())
 
 
 if __name__ == '__main__':